@@ -1,6 +1,7 @@
 from gevent import monkey
 monkey.patch_all() 
 
+import os
 from tuned import create_app
 from tuned.extensions import socketio
 
@@ -12,7 +13,7 @@ if __name__ == '__main__':
         debug=app.debug,
         host='0.0.0.0',
         port=5000,
-        use_reloader=True,
+        use_reloader=os.environ.get('FLASK_ENV') == 'development',
         ping_timeout=60,
         ping_interval=25
     )
@@ -5,7 +5,9 @@ Provides reusable fixtures for testing the Flask application.
 """
 import pytest
 import os
+import fakeredis
 import uuid
+from datetime import datetime, timezone
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.schema import CheckConstraint
@@ -43,12 +45,109 @@ UUID.bind_processor = patched_bind_processor
 
 from tuned import create_app
 from tuned.extensions import db as _db
-from tuned.models.user import User, GenderEnum
+from tuned.models.user import GenderEnum
+from tuned.models.blog import BlogCategory, BlogPost, BlogComment
 from tuned.utils.auth import hash_password
-from datetime import datetime, timezone
+from tests.factories import UserFactory, ADMIN_PASSWORD_HASH
+from sqlalchemy import event
 import sys
-from unittest.mock import MagicMock
-sys.modules['celery'] = MagicMock()
+import types
+import logging
+
+
+def _install_celery_stub():
+    """
+    Register a minimal stand-in for the ``celery`` package.
+
+    Only the names the codebase imports are provided. Decorated tasks keep
+    ``delay``/``apply_async`` as no-ops so event handlers can dispatch freely.
+    """
+    class Task:
+        def __call__(self, *args, **kwargs):
+            return self.run(*args, **kwargs)
+
+    class _StubTask:
+        def __init__(self, fn):
+            self.run = fn
+
+        def __call__(self, *args, **kwargs):
+            return self.run(*args, **kwargs)
+
+        def delay(self, *args, **kwargs):
+            return None
+
+        def apply_async(self, *args, **kwargs):
+            return None
+
+    class Celery:
+        def __init__(self, *args, **kwargs):
+            self.conf = types.SimpleNamespace(update=lambda *a, **k: None)
+
+        def task(self, *args, **kwargs):
+            if len(args) == 1 and callable(args[0]) and not kwargs:
+                return _StubTask(args[0])
+            return _StubTask
+
+    celery = types.ModuleType('celery')
+    celery.Celery = Celery
+    celery.Task = Task
+    celery.shared_task = Celery().task
+    utils = types.ModuleType('celery.utils')
+    log = types.ModuleType('celery.utils.log')
+    log.get_task_logger = logging.getLogger
+    celery.utils = utils
+    utils.log = log
+    sys.modules.update({'celery': celery, 'celery.utils': utils, 'celery.utils.log': log})
+
+
+_install_celery_stub()
+
+
+def _enable_sqlite_savepoints(engine):
+    """
+    Let pysqlite honour SAVEPOINTs.
+
+    The driver defers BEGIN until the first DML statement, so a SAVEPOINT issued
+    on a fresh connection silently becomes the outermost transaction and its
+    RELEASE commits. Take over transaction control and emit BEGIN ourselves.
+
+    Also trade durability for speed and enforce foreign keys (so ON DELETE
+    CASCADE behaves as it does on Postgres).
+    """
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_autobegin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'connect')
+    def _set_test_pragmas(dbapi_connection, connection_record):
+        # Durability is irrelevant here; isolation comes from the per-test rollback
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA synchronous=OFF')
+        cursor.execute('PRAGMA journal_mode=MEMORY')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+
+_TEST_CONFIG = {
+    'TESTING': True,
+    'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',  # In-memory database, private to each xdist worker
+    'WTF_CSRF_ENABLED': False,
+    'MAIL_SUPPRESS_SEND': True,
+    'CELERY_TASK_ALWAYS_EAGER': True,  # Run Celery tasks synchronously
+    # 'JWT_SECRET_KEY': 'test-secret-key-for-testing-only',
+    'SECRET_KEY': 'test-secret-key-for-testing-only',
+    'TESTING_FAST_HASH': True,  # Minimum-cost password hashing, see tests/README.md
+    'SQLALCHEMY_RAISELOAD': True,  # Turn accidental lazy loads into errors
+    # 'JWT_TOKEN_LOCATION': ['headers'],
+    # 'JWT_HEADER_NAME': 'Authorization',
+    # 'JWT_HEADER_TYPE': 'Bearer',
+}
+
 
 @pytest.fixture(scope='session')
 def app():
@@ -64,125 +163,175 @@ def app():
     app = create_app()
     
     # Override config for testing
-    app.config.update({
-        'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',  # In-memory database
-        'WTF_CSRF_ENABLED': False,
-        'CELERY_TASK_ALWAYS_EAGER': True,  # Run Celery tasks synchronously
-        'REDIS_URL': 'redis://localhost:6379/15',  # Separate Redis DB for tests
-        # 'JWT_SECRET_KEY': 'test-secret-key-for-testing-only',
-        'SECRET_KEY': 'test-secret-key-for-testing-only',
-        # 'JWT_TOKEN_LOCATION': ['headers'],
-        # 'JWT_HEADER_NAME': 'Authorization',
-        # 'JWT_HEADER_TYPE': 'Bearer',
-    })
+    app.config.update(_TEST_CONFIG)
     
     # Create application context
     with app.app_context():
-        _db.create_all()
         yield app
-        _db.session.remove()
-        _db.drop_all()
 
 
 @pytest.fixture(scope='function')
 def client(app):
     """
     Create a test client for making HTTP requests.
+
+    Kept function-scoped: the client carries the session cookie, so sharing
+    it would leak logins between tests. Creating one is cheap next to the
+    session-scoped app it wraps.
     """
     return app.test_client()
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def db(app):
     """
-    Provide a fresh database for each test function.
+    Create the database schema once for the whole test session.
     """
     with app.app_context():
+        _enable_sqlite_savepoints(_db.engine)
         _db.create_all()
         yield _db
+        # No drop_all(): the in-memory database goes away with the process.
         _db.session.remove()
-        _db.drop_all()
 
 
 @pytest.fixture(scope='function')
-def sample_user(db):
+def db_session(app, db):
+    """
+    Run each test inside a transaction that is rolled back on teardown.
+
+    The session joins an outer transaction on a dedicated connection and works
+    in a SAVEPOINT, so ``commit()`` and ``rollback()`` inside the test (or the
+    code under test) never reach the outer transaction.
+    """
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+
+        # Flask-SQLAlchemy resolves binds through ``db.engines`` rather than
+        # ``Session.bind``, so point the default bind at the test connection.
+        engines = db.engines
+        engine = engines[None]
+        engines[None] = connection
+        db.session.configure(join_transaction_mode='create_savepoint')
+
+        yield db.session
+
+        db.session.remove()
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope='function')
+def sample_user(db_session):
     """
     Create a sample user for testing.
     
     Returns:
         User: Test user with verified email
     """
-    user = User(
+    return UserFactory(
         username='testuser',
         email='test@example.com',
-        first_name='Test',
-        last_name='User',
-        gender=GenderEnum.MALE,
         phone_number='+1234567890',
-        email_verified=True,
-        created_at=datetime.now(timezone.utc)
+        referral_code='TESTREF1'
     )
-    user.set_password('TestPass123!')
-    user.referral_code = 'TESTREF1'
-    
-    db.session.add(user)
-    db.session.commit()
-    
-    return user
 
 
 @pytest.fixture(scope='function')
-def unverified_user(db):
+def unverified_user(db_session):
     """
     Create a user with unverified email.
     
     Returns:
         User: Test user without email verification
     """
-    user = User(
+    return UserFactory(
         username='unverified',
         email='unverified@example.com',
         first_name='Unverified',
-        last_name='User',
         gender=GenderEnum.FEMALE,
         email_verified=False,
-        created_at=datetime.now(timezone.utc)
+        referral_code='TESTREF2'
     )
-    user.set_password('TestPass123!')
-    user.referral_code = 'TESTREF2'
-    
-    db.session.add(user)
-    db.session.commit()
-    
-    return user
 
 
 @pytest.fixture(scope='function')
-def admin_user(db):
+def admin_user(db_session):
     """
     Create an admin user for testing.
     
     Returns:
         User: Test admin user
     """
-    user = User(
+    return UserFactory(
         username='admin',
         email='admin@example.com',
         first_name='Admin',
-        last_name='User',
-        gender=GenderEnum.MALE,
         is_admin=True,
-        email_verified=True,
-        created_at=datetime.now(timezone.utc)
+        password_hash=ADMIN_PASSWORD_HASH,
+        referral_code='ADMINREF'
+    )
+
+
+@pytest.fixture(scope='function')
+def blog_category(db_session):
+    """
+    Create a blog category.
+
+    Function-scoped: rows are rolled back with each test's transaction.
+    
+    Returns:
+        BlogCategory: 'Tech' category
+    """
+    category = BlogCategory(name='Tech', slug='tech')
+    db_session.add(category)
+    db_session.flush()
+    
+    return category
+
+
+@pytest.fixture(scope='function')
+def blog_post(db_session, blog_category):
+    """
+    Create a published blog post in ``blog_category``.
+    
+    Returns:
+        BlogPost: Post with slug 'test-blog'
+    """
+    post = BlogPost(
+        title='Test Blog',
+        slug='test-blog',
+        content='Content here',
+        author='Author',
+        category_id=blog_category.id,
+        is_published=True,
+        published_at=datetime.now(timezone.utc)
     )
-    user.set_password('AdminPass123!')
-    user.referral_code = 'ADMINREF'
+    db_session.add(post)
+    db_session.flush()
+    
+    return post
+
+
+@pytest.fixture(scope='function')
+def blog_comment(db_session, blog_post):
+    """
+    Create an approved comment on ``blog_post``.
     
-    db.session.add(user)
-    db.session.commit()
+    Returns:
+        BlogComment: Approved comment
+    """
+    comment = BlogComment(
+        post_id=blog_post.id,
+        content='Nice post',
+        approved=True
+    )
+    db_session.add(comment)
+    db_session.flush()
     
-    return user
+    return comment
 
 
 # @pytest.fixture(scope='function')
@@ -204,17 +353,82 @@ def admin_user(db):
 #     }
 
 
+@pytest.fixture(scope='session')
+def _session_identifier(app):
+    """
+    Flask-Login "strong" session-protection identifier for the test client.
+
+    It only depends on the client's remote address and user agent, so it is
+    computed once per session.
+    """
+    from flask_login.utils import _create_identifier
+
+    with app.test_request_context(environ_base=app.test_client().environ_base):
+        return _create_identifier()
+
+
+@pytest.fixture
+def login_as(client, _session_identifier):
+    """
+    Authenticate the test client as a given user.
+
+    Writes the Flask-Login session keys directly instead of posting to
+    ``/api/auth/login``, so tests that only need an authenticated client
+    skip the password check and login side effects.
+
+    Usage:
+        login_as(admin_user)
+    """
+    def _login(user):
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(user.id)
+            sess['_fresh'] = True
+            sess['_id'] = _session_identifier
+        return client
+    return _login
+
+
+@pytest.fixture(scope='session')
+def _fake_redis():
+    """
+    In-process Redis shared by the whole test session.
+    """
+    return fakeredis.FakeStrictRedis(decode_responses=True)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _patch_redis(_fake_redis):
+    """
+    Route every Redis call made by the app to the fake server.
+
+    Most modules bind ``redis_client`` by name at import time, so besides
+    swapping the module attribute the original client is pointed at the fake
+    server's connection pool.
+    """
+    import tuned.redis_client as redis_module
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(redis_module.redis_client, 'connection_pool', _fake_redis.connection_pool)
+        mp.setattr(redis_module, 'redis_client', _fake_redis)
+        yield
+
+
+@pytest.fixture(scope='function', autouse=True)
+def _flush_redis(_fake_redis):
+    """
+    Clear the fake Redis after every test so rate limits and cooldowns
+    never carry over.
+    """
+    yield
+    _fake_redis.flushdb()
+
+
 @pytest.fixture(scope='function')
-def mock_redis(mocker):
+def mock_redis(_fake_redis):
     """
-    Mock Redis client for testing.
+    Provide the fake Redis client for tests that inspect its state.
     """
-    mock = mocker.patch('tuned.redis_client.redis_client')
-    mock.get.return_value = None
-    mock.setex.return_value = True
-    mock.exists.return_value = 0
-    mock.incr.return_value = 1
-    return mock
+    return _fake_redis
 
 
 @pytest.fixture(scope='function')
@@ -226,8 +440,17 @@ def mock_celery(mocker):
 
 
 @pytest.fixture(scope='function')
-def mock_mail(mocker):
+def mail_outbox(app):
     """
-    Mock Flask-Mail for email testing.
+    Capture outgoing mail for the duration of a test.
+
+    MAIL_SUPPRESS_SEND already stops every send for the whole session, so
+    only request this when a test inspects the ``Message`` objects.
+
+    Usage:
+        assert mail_outbox[-1].recipients == [user.email]
     """
-    return mocker.patch('tuned.extensions.mail.send')
+    from tuned.extensions import mail
+
+    with mail.record_messages() as outbox:
+        yield outbox
@@ -0,0 +1,40 @@
+"""
+Model factories for tests.
+
+Password hashes are computed once at import with the minimum-cost method
+(see ``TESTING_FAST_HASH`` in tests/README.md), so building a user is a
+single INSERT with no hashing.
+"""
+
+import factory
+from factory.alchemy import SQLAlchemyModelFactory
+from werkzeug.security import generate_password_hash
+
+from tuned.extensions import db
+from tuned.models.user import User, GenderEnum
+from tuned.utils.auth.password import FAST_HASH_METHOD
+
+TEST_PASSWORD = 'TestPass123!'
+ADMIN_PASSWORD = 'AdminPass123!'
+
+# Each hash embeds its own salt, so sharing it between users is safe for
+# ``User.check_password``.
+TEST_PASSWORD_HASH = generate_password_hash(TEST_PASSWORD, method=FAST_HASH_METHOD)
+ADMIN_PASSWORD_HASH = generate_password_hash(ADMIN_PASSWORD, method=FAST_HASH_METHOD)
+
+
+class UserFactory(SQLAlchemyModelFactory):
+    """Verified user with the default test password."""
+
+    class Meta:
+        model = User
+        sqlalchemy_session = db.session
+        sqlalchemy_session_persistence = 'commit'
+
+    username = factory.Sequence(lambda n: f'user{n}')
+    email = factory.Sequence(lambda n: f'user{n}@example.com')
+    first_name = 'Test'
+    last_name = 'User'
+    gender = GenderEnum.MALE
+    email_verified = True
+    password_hash = TEST_PASSWORD_HASH
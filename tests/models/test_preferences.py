@@ -83,7 +83,7 @@ class TestUserNotificationPreferences:
         db_session.commit()
         
         # Preferences should be deleted
-        deleted_prefs = db_session.query(UserNotificationPreferences).get(pref_id)
+        deleted_prefs = db_session.get(UserNotificationPreferences, pref_id)
         assert deleted_prefs is None
 
 
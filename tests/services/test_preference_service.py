@@ -5,8 +5,12 @@ Tests all preference_service functions including initialization,
 retrieval, export, import, and reset.
 """
 
+import uuid
 import pytest
+from types import SimpleNamespace
+from sqlalchemy import Column, Integer, MetaData, String, Table, func
 from tuned.services.preference_service import (
+    _column_defaults,
     initialize_user_preferences,
     get_all_user_preferences,
     export_user_preferences,
@@ -37,7 +41,7 @@ class TestInitializeUserPreferences:
         assert result['billing'] is True
         
         # Verify preferences exist in database
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         assert user.notification_preferences is not None
         assert user.email_preferences is not None
         assert user.privacy_settings is not None
@@ -65,13 +69,13 @@ class TestInitializeUserPreferences:
         
         initialize_user_preferences(test_user.id)
         
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         assert user.localization_settings.language == 'es'
         assert user.localization_settings.timezone == 'America/New_York'
     
     def test_initialize_nonexistent_user(self, db_session):
         """Test initialization with non-existent user."""
-        result = initialize_user_preferences(99999)
+        result = initialize_user_preferences(uuid.uuid4())
         
         assert result['success'] is False
         assert 'error' in result
@@ -101,12 +105,12 @@ class TestGetAllUserPreferences:
         
         assert prefs is not None
         # Preferences should be created automatically
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         assert user.notification_preferences is not None
     
     def test_get_all_nonexistent_user(self, db_session):
         """Test getting preferences for non-existent user."""
-        prefs = get_all_user_preferences(99999)
+        prefs = get_all_user_preferences(uuid.uuid4())
         
         assert prefs is None
 
@@ -139,7 +143,7 @@ class TestExportUserPreferences:
     
     def test_export_nonexistent_user(self, db_session):
         """Test export for non-existent user."""
-        export = export_user_preferences(99999)
+        export = export_user_preferences(uuid.uuid4())
         
         assert export is None
 
@@ -172,7 +176,7 @@ class TestImportUserPreferences:
         assert 'email' in result['imported_categories']
         
         # Verify changes
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         assert user.notification_preferences.email_notifications is False
         assert user.email_preferences.newsletter is True
     
@@ -196,7 +200,7 @@ class TestImportUserPreferences:
         assert len(result['validation_errors']) > 0
         
         # Critical emails should remain True
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         assert user.email_preferences.order_confirmations is True
         assert user.email_preferences.payment_receipts is True
         assert user.email_preferences.account_security is True
@@ -204,7 +208,7 @@ class TestImportUserPreferences:
     def test_import_nonexistent_user(self, db_session):
         """Test import for non-existent user."""
         import_data = {'preferences': {}}
-        result = import_user_preferences(99999, import_data)
+        result = import_user_preferences(uuid.uuid4(), import_data)
         
         assert result['success'] is False
 
@@ -217,7 +221,7 @@ class TestResetPreferencesToDefaults:
         initialize_user_preferences(test_user.id)
         
         # Modify some preferences
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         user.notification_preferences.email_notifications = False
         user.email_preferences.newsletter = True
         db_session.commit()
@@ -239,7 +243,7 @@ class TestResetPreferencesToDefaults:
         initialize_user_preferences(test_user.id)
         
         # Modify notification preferences
-        user = User.query.get(test_user.id)
+        user = db_session.get(User, test_user.id)
         user.notification_preferences.email_notifications = False
         user.email_preferences.newsletter = True
         db_session.commit()
@@ -270,6 +274,34 @@ class TestResetPreferencesToDefaults:
     
     def test_reset_nonexistent_user(self, db_session):
         """Test reset for non-existent user."""
-        result = reset_preferences_to_defaults(99999)
+        result = reset_preferences_to_defaults(uuid.uuid4())
         
         assert result['success'] is False
+
+
+class TestColumnDefaults:
+    """Tests for the reset values derived from model column defaults."""
+
+    @staticmethod
+    def _model(*columns):
+        table = Table('prefs', MetaData(), Column('id', Integer, primary_key=True), *columns)
+        return SimpleNamespace(__name__='Prefs', __table__=table)
+
+    def test_scalar_and_nullable_columns(self):
+        """Test that scalar defaults are used and nullable columns reset to NULL."""
+        model = self._model(
+            Column('frequency', Integer, default=3, nullable=False),
+            Column('label', String, nullable=True)
+        )
+
+        assert _column_defaults(model) == {'frequency': 3, 'label': None}
+
+    @pytest.mark.parametrize('column', [
+        Column('frequency', Integer, nullable=False),
+        Column('frequency', Integer, default=lambda: 3, nullable=False),
+        Column('frequency', Integer, default=func.random(), nullable=True),
+    ])
+    def test_columns_without_scalar_default_are_rejected(self, column):
+        """Test that non-scalar defaults and required columns without a default raise."""
+        with pytest.raises(ValueError, match='Prefs.frequency'):
+            _column_defaults(self._model(column))
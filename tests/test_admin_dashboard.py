@@ -1,4 +1,3 @@
-import json
 import pytest
 from datetime import datetime, timezone
 from tuned.models import Order, User
@@ -12,16 +11,14 @@ def test_admin_dashboard_unauthenticated(client):
         response = client.get(f"/admin/dashboard/{endpoint}")
         assert response.status_code in (302, 401)
 
-def test_admin_dashboard_unauthorized(client, sample_user, mock_redis):
+def test_admin_dashboard_unauthorized(client, login_as, sample_user):
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': sample_user.email, 'password': 'TestPass123!'}),
-                    content_type='application/json')
+        login_as(sample_user)
         for endpoint in ["kpis", "analytics", "tracking", "alerts"]:
             response = client.get(f"/admin/dashboard/{endpoint}")
             assert response.status_code == 403
 
-def test_admin_dashboard_success(client, db, admin_user, mock_redis):
+def test_admin_dashboard_success(client, login_as, db_session, admin_user):
     # Setup test data
     order = Order(
         client_id=admin_user.id,
@@ -39,13 +36,13 @@ def test_admin_dashboard_success(client, db, admin_user, mock_redis):
         title="Admin Test Order 2",
         due_date=datetime.now(timezone.utc)
     )
-    db.session.add_all([order, order_review])
-    db.session.commit()
+    db_session.add_all([order, order_review])
+    db_session.commit()
 
     # Setup payment method and payment
     method = AcceptedPaymentMethod(name="PayPal", category="digital_wallet")
-    db.session.add(method)
-    db.session.commit()
+    db_session.add(method)
+    db_session.commit()
 
     payment = Payment(
         order_id=order.id,
@@ -54,8 +51,8 @@ def test_admin_dashboard_success(client, db, admin_user, mock_redis):
         accepted_method_id=method.id,
         status=PaymentStatus.COMPLETED
     )
-    db.session.add(payment)
-    db.session.commit()
+    db_session.add(payment)
+    db_session.commit()
 
     # Setup extension request
     extension = OrderDeadlineExtensionRequest(
@@ -67,8 +64,8 @@ def test_admin_dashboard_success(client, db, admin_user, mock_redis):
         status=ExtensionRequestStatus.PENDING,
         priority=Priority.NORMAL
     )
-    db.session.add(extension)
-    db.session.commit()
+    db_session.add(extension)
+    db_session.commit()
 
     # Setup Activity Log
     act_log = ActivityLog(
@@ -77,13 +74,11 @@ def test_admin_dashboard_success(client, db, admin_user, mock_redis):
         entity_type="Order",
         entity_id=order.id
     )
-    db.session.add(act_log)
-    db.session.commit()
+    db_session.add(act_log)
+    db_session.commit()
 
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': admin_user.email, 'password': 'AdminPass123!'}),
-                    content_type='application/json')
+        login_as(admin_user)
         
         # Test KPIs
         resp_kpis = client.get("/admin/dashboard/kpis")
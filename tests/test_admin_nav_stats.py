@@ -1,4 +1,3 @@
-import json
 import pytest
 from tuned.models import Order
 from tuned.models.order import OrderComment
@@ -10,12 +9,10 @@ def test_admin_nav_stats_unauthenticated(client):
     # Unauthorized redirect or 401 response
     assert response.status_code in (302, 401)
 
-def test_admin_nav_stats_unauthorized(client, sample_user, mock_redis):
+def test_admin_nav_stats_unauthorized(client, login_as, sample_user):
     # Log in as non-admin user
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': sample_user.email, 'password': 'TestPass123!'}),
-                    content_type='application/json')
+        login_as(sample_user)
         
         response = client.get('/api/admin/nav-stats')
         # Expected: 403 Forbidden because is_admin is False
@@ -24,7 +21,7 @@ def test_admin_nav_stats_unauthorized(client, sample_user, mock_redis):
         assert data['success'] is False
         assert data['message'] == "Administrator privilege required"
 
-def test_admin_nav_stats_success(client, db, admin_user, mock_redis):
+def test_admin_nav_stats_success(client, login_as, db_session, admin_user):
     # Create some dummy data in DB
     order1 = Order(
         client_id=admin_user.id,
@@ -42,8 +39,8 @@ def test_admin_nav_stats_success(client, db, admin_user, mock_redis):
         title="Test Order 2"
     )
     # Ensure ID is generated
-    db.session.add_all([order1, order2])
-    db.session.commit()
+    db_session.add_all([order1, order2])
+    db_session.commit()
 
     comment = OrderComment(
         order_id=order1.id,
@@ -58,14 +55,12 @@ def test_admin_nav_stats_success(client, db, admin_user, mock_redis):
         rating=5,
         is_approved=False
     )
-    db.session.add_all([comment, testimonial])
-    db.session.commit()
+    db_session.add_all([comment, testimonial])
+    db_session.commit()
 
     # Log in as admin user
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': admin_user.email, 'password': 'AdminPass123!'}),
-                    content_type='application/json')
+        login_as(admin_user)
         
         response = client.get('/api/admin/nav-stats')
         assert response.status_code == 200
@@ -0,0 +1,65 @@
+import json
+import redis
+from tuned.models import Order
+from tuned.models.enums import OrderStatus
+from tuned.apis.admin.routes import orders as admin_orders_routes
+from tuned.apis.admin.routes.orders import STATS_CACHE_KEY, STATS_CACHE_TTL
+
+
+def _add_pending_order(db_session, client_id):
+    order = Order(
+        client_id=client_id,
+        status=OrderStatus.PENDING,
+        total_price=100.0,
+        currency="USD",
+        title="Stats Test Order"
+    )
+    db_session.add(order)
+    db_session.commit()
+    return order
+
+
+def test_admin_orders_stats_cache_hit(client, login_as, db_session, admin_user, mock_redis):
+    cached = {"stats": {"all": 42, "pending": 7}, "bottlenecks": {}, "service_load": []}
+    mock_redis.set(STATS_CACHE_KEY, json.dumps(cached), ex=STATS_CACHE_TTL)
+
+    with client:
+        login_as(admin_user)
+        response = client.get('/api/admin/orders/stats')
+
+    assert response.status_code == 200
+    assert response.get_json()['data'] == cached
+
+
+def test_admin_orders_stats_cache_miss_stores_value(client, login_as, db_session, admin_user, mock_redis):
+    _add_pending_order(db_session, admin_user.id)
+
+    with client:
+        login_as(admin_user)
+        response = client.get('/api/admin/orders/stats')
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['stats']['all'] == 1
+    assert data['stats']['pending'] == 1
+    assert json.loads(mock_redis.get(STATS_CACHE_KEY)) == data
+    assert 0 < mock_redis.ttl(STATS_CACHE_KEY) <= STATS_CACHE_TTL
+
+
+def test_admin_orders_stats_redis_failure_falls_back(client, login_as, db_session, admin_user, monkeypatch):
+    _add_pending_order(db_session, admin_user.id)
+
+    def _unavailable(*args, **kwargs):
+        raise redis.ConnectionError("Redis is down")
+
+    monkeypatch.setattr(admin_orders_routes.redis_client, 'get', _unavailable)
+    monkeypatch.setattr(admin_orders_routes.redis_client, 'set', _unavailable)
+
+    with client:
+        login_as(admin_user)
+        response = client.get('/api/admin/orders/stats')
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['stats']['all'] == 1
+    assert data['stats']['pending'] == 1
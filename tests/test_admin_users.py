@@ -16,11 +16,9 @@ def test_admin_users_unauthenticated(client):
     assert response.status_code in (302, 401)
 
 
-def test_admin_users_unauthorized(client, sample_user, mock_redis):
+def test_admin_users_unauthorized(client, login_as, sample_user):
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': sample_user.email, 'password': 'TestPass123!'}),
-                    content_type='application/json')
+        login_as(sample_user)
         
         for endpoint in ["stats", "geography", "export"]:
             response = client.get(f"/admin/users/{endpoint}")
@@ -30,7 +28,7 @@ def test_admin_users_unauthorized(client, sample_user, mock_redis):
         assert response.status_code == 403
 
 
-def test_admin_users_success(client, db, admin_user, sample_user, mock_redis):
+def test_admin_users_success(client, login_as, db_session, admin_user, sample_user):
     # Set up some order and payment history for the sample user
     order = Order(
         client_id=sample_user.id,
@@ -40,12 +38,12 @@ def test_admin_users_success(client, db, admin_user, sample_user, mock_redis):
         title="Admin Users Test Order",
         due_date=datetime.now(timezone.utc) - timedelta(days=2)
     )
-    db.session.add(order)
-    db.session.commit()
+    db_session.add(order)
+    db_session.commit()
 
     method = AcceptedPaymentMethod(name="PayPal", category="digital_wallet")
-    db.session.add(method)
-    db.session.commit()
+    db_session.add(method)
+    db_session.commit()
 
     payment = Payment(
         order_id=order.id,
@@ -54,21 +52,19 @@ def test_admin_users_success(client, db, admin_user, sample_user, mock_redis):
         accepted_method_id=method.id,
         status=PaymentStatus.COMPLETED
     )
-    db.session.add(payment)
-    db.session.commit()
+    db_session.add(payment)
+    db_session.commit()
 
     # Create localization settings for geography test
     loc = UserLocalizationSettings(
         user_id=sample_user.id,
         country_code="US"
     )
-    db.session.add(loc)
-    db.session.commit()
+    db_session.add(loc)
+    db_session.commit()
 
     with client:
-        client.post('/api/auth/login', 
-                    data=json.dumps({'identifier': admin_user.email, 'password': 'AdminPass123!'}),
-                    content_type='application/json')
+        login_as(admin_user)
 
         # Test users stats
         resp_stats = client.get("/admin/users/stats")
@@ -123,15 +119,15 @@ def test_admin_users_success(client, db, admin_user, sample_user, mock_redis):
         assert sample_user.email in csv_data
 
 
-def test_user_registration_initializes_preferences(db, sample_user, mocker):
+def test_user_registration_initializes_preferences(db_session, sample_user, mocker):
     # Mock get_country_code_from_ip to return "KE" for a valid IP address
     mocker.patch("tuned.interface.users.events.get_country_code_from_ip", return_value="KE")
 
     # Manually delete existing localization preferences for this user to test initialization
-    loc_pref = db.session.query(UserLocalizationSettings).filter_by(user_id=sample_user.id).first()
+    loc_pref = db_session.query(UserLocalizationSettings).filter_by(user_id=sample_user.id).first()
     if loc_pref:
-        db.session.delete(loc_pref)
-        db.session.commit()
+        db_session.delete(loc_pref)
+        db_session.commit()
 
     # Trigger user.registered event
     get_event_bus().emit("user.registered", {
@@ -143,7 +139,7 @@ def test_user_registration_initializes_preferences(db, sample_user, mocker):
     })
 
     # Assert settings were created and country_code set to KE
-    db.session.expire_all()
-    loc_settings = db.session.query(UserLocalizationSettings).filter_by(user_id=sample_user.id).first()
+    db_session.expire_all()
+    loc_settings = db_session.query(UserLocalizationSettings).filter_by(user_id=sample_user.id).first()
     assert loc_settings is not None
     assert loc_settings.country_code == "KE"
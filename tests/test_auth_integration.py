@@ -4,14 +4,18 @@ Integration tests for authentication flow.
 Tests complete user journeys from registration through login and logout.
 """
 import pytest
-import json
+from types import SimpleNamespace
+from sqlalchemy.exc import IntegrityError
 from tuned.models.user import User
+from tuned.repository.exceptions import AlreadyExists
+from tuned.apis.auth.routes.auth import _duplicate_field
+from tuned.interface.users.service import UserService
 
 
 class TestAuthenticationFlow:
     """Integration tests for complete authentication flows."""
     
-    def test_complete_registration_to_login_flow(self, client, db, app, mock_mail, mock_redis):
+    def test_complete_registration_to_login_flow(self, client, db_session):
         """Test complete flow: register → verify email → login."""
         # Step 1: Register new user
         registration_data = {
@@ -25,8 +29,7 @@ class TestAuthenticationFlow:
         }
         
         response = client.post('/auth/register',
-                              data=json.dumps(registration_data),
-                              content_type='application/json')
+                              json=registration_data)
         
         assert response.status_code == 201
         user_data = response.get_json()['data']
@@ -39,8 +42,7 @@ class TestAuthenticationFlow:
         }
         
         response = client.post('/auth/login',
-                              data=json.dumps(login_data),
-                              content_type='application/json')
+                              json=login_data)
         
         assert response.status_code == 403
         assert 'verify your email' in response.get_json()['message'].lower()
@@ -50,80 +52,71 @@ class TestAuthenticationFlow:
         assert user is not None
         
         from tuned.utils.tokens import generate_verification_token
-        with app.app_context():
-            token = generate_verification_token(user.id, user.email)
+        token = generate_verification_token(user.id, user.email)
         
         response = client.post('/auth/verify-email',
-                              data=json.dumps({'token': token}),
-                              content_type='application/json')
+                              json={'token': token})
         
         assert response.status_code == 200
         
         # Step 4: Login after verification (should succeed)
         response = client.post('/auth/login',
-                              data=json.dumps(login_data),
-                              content_type='application/json')
+                              json=login_data)
         
         assert response.status_code == 200
         json_data = response.get_json()
         assert 'access_token' in json_data['data']
         assert 'refresh_token' in json_data['data']
     
-    def test_password_reset_flow(self, client, db, sample_user, app, mock_mail, mock_redis):
+    def test_password_reset_flow(self, client, db_session, sample_user):
         """Test complete password reset flow."""
         # Step 1: Request password reset
         response = client.post('/auth/password-reset/request',
-                              data=json.dumps({'email': sample_user.email}),
-                              content_type='application/json')
+                              json={'email': sample_user.email})
         
         assert response.status_code == 200
         
         # Step 2: Get reset token (simulating email click)
         from tuned.utils.tokens import generate_password_reset_token
-        with app.app_context():
-            reset_token = generate_password_reset_token(sample_user.id, sample_user.email)
+        reset_token = generate_password_reset_token(sample_user.id, sample_user.email)
         
         # Step 3: Confirm password reset
         new_password = 'NewSecurePassword123!'
         response = client.post('/auth/password-reset/confirm',
-                              data=json.dumps({
+                              json={
                                   'token': reset_token,
                                   'new_password': new_password,
                                   'confirm_password': new_password
-                              }),
-                              content_type='application/json')
+                              })
         
         assert response.status_code == 200
         
         # Step 4: Login with new password
         response = client.post('/auth/login',
-                              data=json.dumps({
+                              json={
                                   'email': sample_user.email,
                                   'password': new_password
-                              }),
-                              content_type='application/json')
+                              })
         
         assert response.status_code == 200
         
         # Step 5: Verify old password doesn't work
         response = client.post('/auth/login',
-                              data=json.dumps({
+                              json={
                                   'email': sample_user.email,
                                   'password': 'TestPass123!'
-                              }),
-                              content_type='application/json')
+                              })
         
         assert response.status_code == 401
     
-    def test_login_logout_flow(self, client, db, sample_user, mock_redis):
+    def test_login_logout_flow(self, client, db_session, sample_user):
         """Test login → logout → attempt access flow."""
         # Step 1: Login
         response = client.post('/auth/login',
-                              data=json.dumps({
+                              json={
                                   'email': sample_user.email,
                                   'password': 'TestPass123!'
-                              }),
-                              content_type='application/json')
+                              })
         
         assert response.status_code == 200
         access_token = response.get_json()['data']['access_token']
@@ -138,40 +131,140 @@ class TestAuthenticationFlow:
         # (Would need a protected endpoint to test this properly)
         # This is a placeholder for when you add protected routes
     
-    def test_account_lockout_flow(self, client, db, sample_user, mock_redis):
+    def test_account_lockout_flow(self, client, db_session, sample_user):
         """Test account lockout after failed login attempts."""
         login_data = {
             'email': sample_user.email,
             'password': 'WrongPassword123!'
         }
         
-        # Make 5 failed login attempts
-        for _ in range(5):
-            response = client.post('/auth/login',
-                                  data=json.dumps(login_data),
-                                  content_type='application/json')
-            assert response.status_code == 401
+        # Start just below the threshold instead of replaying four failed logins
+        sample_user.failed_login_attempts = 4
+        db_session.commit()
+        
+        # 5th failed attempt
+        response = client.post('/auth/login',
+                              json=login_data)
+        assert response.status_code == 401
         
         # 6th attempt should trigger lockout
         response = client.post('/auth/login',
-                              data=json.dumps(login_data),
-                              content_type='application/json')
+                              json=login_data)
         
         # Depending on implementation, might be 401 or 403
         # For now, verify user's failed_login_attempts increased
-        db.session.refresh(sample_user)
+        db_session.expire(sample_user, ['failed_login_attempts'])
         assert sample_user.failed_login_attempts >= 5
     
-    def test_resend_verification_email(self, client, db, unverified_user, mock_mail, mock_redis):
+    def test_resend_verification_email(self, client, db_session, unverified_user, mock_redis):
         """Test resending verification email."""
         response = client.post('/auth/resend-verification',
-                              data=json.dumps({'email': unverified_user.email}),
-                              content_type='application/json')
+                              json={'email': unverified_user.email})
         
         assert response.status_code == 200
         
         # Generic success message for security
         assert response.get_json()['success'] is True
+        
+        # Resend is rate limited through a Redis cooldown key
+        assert mock_redis.ttl(f'email_resend_cooldown:{unverified_user.email}') > 0
+
+
+class _UniqueViolation(Exception):
+    """
+    Stand-in for ``psycopg.errors.UniqueViolation``.
+
+    Mirrors the two attributes ``_duplicate_field`` reads: the error message
+    (``str(exc)``) and ``diag.constraint_name``.
+    """
+
+    def __init__(self, constraint_name, message):
+        super().__init__(message)
+        self.diag = SimpleNamespace(constraint_name=constraint_name)
+
+
+class TestDuplicateRegistration:
+    """Duplicate registrations are rejected by the users table's unique indexes."""
+
+    @staticmethod
+    def _registration(**overrides):
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'SecurePass123!',
+            'confirm_password': 'SecurePass123!',
+            'first_name': 'New',
+            'last_name': 'User',
+            'gender': 'female'
+        }
+        data.update(overrides)
+        return data
+
+    def test_case_variant_email_is_rejected(self, client, db_session, sample_user):
+        """Test that an email differing only in case counts as taken."""
+        response = client.post('/api/auth/register',
+                              json=self._registration(email=sample_user.email.upper()))
+
+        assert response.status_code == 422
+        assert 'email' in response.get_json()['errors']
+        assert User.query.filter(User.username == 'newuser').first() is None
+
+    def test_case_variant_username_is_rejected(self, client, db_session, sample_user):
+        """Test that a username differing only in case counts as taken."""
+        response = client.post('/api/auth/register',
+                              json=self._registration(username=sample_user.username.capitalize()))
+
+        assert response.status_code == 422
+        assert 'username' in response.get_json()['errors']
+        assert User.query.filter(User.email == 'new@example.com').first() is None
+
+    def test_registration_succeeds_after_duplicate(self, client, db_session, sample_user):
+        """Test that a rejected duplicate leaves the session usable."""
+        response = client.post('/api/auth/register',
+                              json=self._registration(email=sample_user.email))
+
+        assert response.status_code == 422
+        assert 'email' in response.get_json()['errors']
+
+        response = client.post('/api/auth/register',
+                              json=self._registration())
+
+        assert response.status_code == 200
+        assert User.query.filter(User.email == 'new@example.com').first() is not None
+
+    def test_postgres_constraint_name_decides_field(self):
+        """Test that the constraint name, not the duplicate value, picks the field."""
+        orig = _UniqueViolation(
+            'uq_users_username',
+            'duplicate key value violates unique constraint "uq_users_username"\n'
+            'DETAIL:  Key (username)=(emailking) already exists.'
+        )
+        exc = AlreadyExists('User already exists')
+        exc.__cause__ = IntegrityError('INSERT INTO users ...', {}, orig)
+
+        assert _duplicate_field(exc) == 'username'
+
+    def test_unrecognized_constraint_falls_back_to_conflict(self, client, db_session, monkeypatch):
+        """Test that a duplicate on a constraint with no field mapping returns a bare 409."""
+        orig = _UniqueViolation(
+            'uq_users_referral_code',
+            'duplicate key value violates unique constraint "uq_users_referral_code"'
+        )
+
+        def _create_user(self, data, locale, referred_by_code=None):
+            exc = AlreadyExists('User already exists')
+            exc.__cause__ = IntegrityError('INSERT INTO users ...', {}, orig)
+            raise exc
+
+        monkeypatch.setattr(UserService, 'create_user', _create_user)
+
+        response = client.post('/api/auth/register',
+                              json=self._registration())
+
+        assert response.status_code == 409
+        json_data = response.get_json()
+        assert json_data['success'] is False
+        assert 'already exists' in json_data['message']
 
 
 class TestErrorHandling:
@@ -185,7 +278,7 @@ class TestErrorHandling:
         
         assert response.status_code == 400
     
-    def test_missing_required_fields(self, client, db):
+    def test_missing_required_fields(self, client, db_session):
         """Test that missing required fields are caught."""
         incomplete_data = {
             'email': 'test@example.com'
@@ -193,8 +286,7 @@ class TestErrorHandling:
         }
         
         response = client.post('/auth/register',
-                              data=json.dumps(incomplete_data),
-                              content_type='application/json')
+                              json=incomplete_data)
         
         assert response.status_code == 422
         json_data = response.get_json()
@@ -203,8 +295,7 @@ class TestErrorHandling:
     def test_empty_request_body(self, client):
         """Test that empty request body is handled."""
         response = client.post('/auth/register',
-                              data=json.dumps({}),
-                              content_type='application/json')
+                              json={})
         
         assert response.status_code in [400, 422]
 
@@ -212,7 +303,7 @@ class TestErrorHandling:
 class TestSecurityFeatures:
     """Test security features and patterns."""
     
-    def test_password_not_returned_in_response(self, client, db, mock_mail, mock_redis):
+    def test_password_not_returned_in_response(self, client, db_session):
         """Test that password is never returned in API responses."""
         registration_data = {
             'username': 'securitytest',
@@ -225,18 +316,16 @@ class TestSecurityFeatures:
         }
         
         response = client.post('/auth/register',
-                              data=json.dumps(registration_data),
-                              content_type='application/json')
+                              json=registration_data)
         
         json_data = response.get_json()
         assert 'password' not in str(json_data).lower() or 'password_hash' not in str(json_data).lower()
     
-    def test_generic_error_messages(self, client, db):
+    def test_generic_error_messages(self, client, db_session):
         """Test that error messages don't reveal user existence."""
         # Test with non-existent email
         response = client.post('/auth/password-reset/request',
-                              data=json.dumps({'email': 'nonexistent@example.com'}),
-                              content_type='application/json')
+                              json={'email': 'nonexistent@example.com'})
         
         # Should return generic success message
         assert response.status_code == 200
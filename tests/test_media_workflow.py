@@ -18,7 +18,7 @@ def make_dummy_file(filename, content=b"dummy file contents"):
     )
 
 
-def test_media_upload_and_permissions(app, db, sample_user, admin_user):
+def test_media_upload_and_permissions(app, db_session, sample_user, admin_user):
     services = get_services()
     
     # 1. Upload a file
@@ -47,8 +47,8 @@ def test_media_upload_and_permissions(app, db, sample_user, admin_user):
         email_verified=True
     )
     other_user.password_hash = hash_password("Password123!")
-    db.session.add(other_user)
-    db.session.commit()
+    db_session.add(other_user)
+    db_session.commit()
     
     assert services.media.verify_download_permission(str(asset_dto.id), other_user) is False
     
@@ -56,7 +56,7 @@ def test_media_upload_and_permissions(app, db, sample_user, admin_user):
     assert services.media.verify_download_permission(str(asset_dto.id), admin_user) is True
 
 
-def test_media_download_api(client, db, app, sample_user, admin_user):
+def test_media_download_api(client, db_session, app, sample_user, admin_user):
     # Log in as sample_user
     login_data = {
         'identifier': sample_user.email,
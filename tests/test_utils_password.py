@@ -8,10 +8,16 @@ from tuned.utils.auth.password import (
     hash_password,
     verify_password,
     check_password_strength,
-    generate_temporary_password
+    generate_temporary_password,
+    FAST_BCRYPT_ROUNDS
 )
 
 
+# Run under the test app so hash_password uses TESTING_FAST_HASH rounds
+pytestmark = pytest.mark.usefixtures('app')
+
+
+@pytest.mark.cpu_bound
 class TestPasswordHashing:
     """Tests for password hashing with bcrypt."""
     
@@ -24,6 +30,7 @@ class TestPasswordHashing:
         assert isinstance(hashed, str)
         assert hashed != password
         assert hashed.startswith('$2b$')  # Bcrypt format
+        assert hashed.startswith(f'$2b${FAST_BCRYPT_ROUNDS:02d}$')
     
     def test_hash_password_generates_different_hashes(self):
         """Test that same password generates different hashes (salt)."""
@@ -140,15 +147,19 @@ class TestTemporaryPassword:
     
     def test_temporary_passwords_are_unique(self):
         """Test that generated passwords are unique."""
-        passwords = [generate_temporary_password() for _ in range(50)]
-        
-        assert len(set(passwords)) == 50  # All unique
+        seen = set()
+        for _ in range(50):
+            temp_pass = generate_temporary_password()
+            assert temp_pass not in seen
+            seen.add(temp_pass)
     
     def test_temporary_password_contains_all_character_types(self):
         """Test that password contains uppercase, lowercase, digit, special."""
         temp_pass = generate_temporary_password()
         
-        assert any(c.isupper() for c in temp_pass)
-        assert any(c.islower() for c in temp_pass)
-        assert any(c.isdigit() for c in temp_pass)
-        assert any(not c.isalnum() for c in temp_pass)
+        # One pass: upper=1, lower=2, digit=4, special=8
+        mask = 0
+        for c in temp_pass:
+            mask |= 1 if c.isupper() else 2 if c.islower() else 4 if c.isdigit() else 8
+        
+        assert mask == 15
@@ -7,6 +7,10 @@ from flask import Flask
 from tuned.core.config import config
 from tuned.core.logging import _configure_logging, get_logger
 
+# Shared error bodies; Flask serialises them per response and never mutates them
+_NOT_FOUND_BODY = {'error': 'Resource not found'}
+_INTERNAL_ERROR_BODY = {'error': 'Internal server error'}
+
 def create_app(config_name: Optional[str] = None) -> Flask:
     app = Flask(__name__)
     
@@ -23,6 +27,12 @@ def create_app(config_name: Optional[str] = None) -> Flask:
 
     app.config.from_object(config[config_name])
     
+    try:
+        from tuned.core.json_provider import OrjsonProvider
+        app.json = OrjsonProvider(app)
+    except ImportError:
+        logger.warning("orjson not installed, using the stdlib JSON provider")
+    
     from tuned.extensions import db, migrate, login_manager, cors, socketio, mail #jwt
     
     db.init_app(app)
@@ -38,12 +48,13 @@ def create_app(config_name: Optional[str] = None) -> Flask:
         allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With"],
     )
 
+    debug = bool(app.config.get('DEBUG', False))
     socketio.init_app(app,
         async_mode='gevent',
         cors_allowed_origins=cors_origins,
         cors_credentials=True,
-        logger=app.config.get('DEBUG', False),
-        engineio_logger=app.config.get('DEBUG', False),
+        logger=debug,
+        engineio_logger=debug,
         message_queue=app.config.get('SOCKETIO_MESSAGE_QUEUE'),
     )
     
@@ -78,7 +89,7 @@ def create_app(config_name: Optional[str] = None) -> Flask:
             uuid_obj = uuid.UUID(user_id)
         except (ValueError, AttributeError):
             return None
-        return db.session.query(User).filter(User.id == uuid_obj).first()
+        return db.session.get(User, uuid_obj)
         
     @login_manager.unauthorized_handler
     def unauthorized():
@@ -128,13 +139,13 @@ def create_app(config_name: Optional[str] = None) -> Flask:
 def register_error_handlers(app: Flask) -> None:
     @app.errorhandler(404)
     def not_found_error(error: Exception) -> tuple[dict[str, str], int]:
-        return {'error': 'Resource not found'}, 404
+        return _NOT_FOUND_BODY, 404
     
     @app.errorhandler(500)
     def internal_error(error: Exception) -> tuple[dict[str, str], int]:
         from tuned.extensions import db
         db.session.rollback()
-        return {'error': 'Internal server error'}, 500
+        return _INTERNAL_ERROR_BODY, 500
 
 
 def register_shell_context(app: Flask) -> None:
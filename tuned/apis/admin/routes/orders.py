@@ -1,3 +1,4 @@
+import json
 from flask import request
 from flask.views import MethodView
 from flask_login import login_required
@@ -11,9 +12,15 @@ from tuned.repository import Repository
 from tuned.extensions import db
 from tuned.core.logging import get_logger
 from tuned.core.exceptions import NotFound
+from tuned.redis_client import redis_client
 
 logger = get_logger(__name__)
 
+# Dashboard polls this; counts up to half a minute old are fine. Entries are
+# never invalidated, order status changes show up once the TTL runs out.
+STATS_CACHE_KEY = 'admin:orders:stats'
+STATS_CACHE_TTL = 30
+
 
 def _make_service() -> AdminOrderService:
     return AdminOrderService(repos=Repository(db.session))
@@ -43,12 +50,24 @@ class AdminOrdersStatsView(MethodView):
 
     def get(self):
         try:
-            result = _make_service().get_orders_stats()
-            return success_response(data=asdict(result), status=200)
+            raw = redis_client.get(STATS_CACHE_KEY)
+            if raw is not None and isinstance(raw, (str, bytes, bytearray)):
+                return success_response(data=json.loads(raw), status=200)
+        except Exception as exc:
+            logger.warning("[AdminOrdersStatsView] Stats cache read failed: %r", exc)
+
+        try:
+            data = asdict(_make_service().get_orders_stats())
         except Exception as exc:
             logger.error("[AdminOrdersStatsView] %r", exc)
             return error_response("Failed to fetch order stats", status=500)
 
+        try:
+            redis_client.set(STATS_CACHE_KEY, json.dumps(data), ex=STATS_CACHE_TTL)
+        except Exception as exc:
+            logger.warning("[AdminOrdersStatsView] Stats cache write failed: %r", exc)
+        return success_response(data=data, status=200)
+
 
 class AdminActivateOrderView(MethodView):
     decorators = [login_required, admin_required]
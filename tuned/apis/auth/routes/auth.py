@@ -18,11 +18,36 @@ from tuned.apis.auth.schemas.registration import RegistrationSchema
 from tuned.dtos import LoginRequestDTO, CreateUserDTO
 from marshmallow import ValidationError
 import logging
-from typing import Any
+from typing import Any, Optional
 
 logger: logging.Logger = get_logger(__name__)
 
 
+# Unique constraints and indexes on the users table, by the field they protect
+_UNIQUE_CONSTRAINT_FIELDS = {
+    'uq_users_email': 'email',
+    'ix_users_lower_email': 'email',
+    'uq_users_username': 'username',
+    'ix_users_lower_username': 'username',
+}
+# SQLite reports the column (``users.email``) or the index name instead
+_UNIQUE_DETAIL_TOKENS = {
+    **_UNIQUE_CONSTRAINT_FIELDS,
+    'users.email': 'email',
+    'users.username': 'username',
+}
+
+
+def _duplicate_field(exc: AlreadyExists) -> Optional[str]:
+    # Uniqueness is enforced by the users table, so the driver error names the constraint
+    orig = getattr(exc.__cause__, 'orig', None)
+    constraint = getattr(getattr(orig, 'diag', None), 'constraint_name', None)
+    if constraint:
+        return _UNIQUE_CONSTRAINT_FIELDS.get(constraint)
+    detail = str(orig or '')
+    return next((field for token, field in _UNIQUE_DETAIL_TOKENS.items() if token in detail), None)
+
+
 class AuthCheck(MethodView):
     def get(self) -> tuple[Any, int]:
         try:
@@ -140,8 +165,11 @@ class Register(MethodView):
             logger.info(f'User {result.get("email")} registered successfully')
             return success_response(result)
 
-        except AlreadyExists:
+        except AlreadyExists as e:
             logger.error(f'User {data.get("email")} already exists')
+            field = _duplicate_field(e)
+            if field:
+                return validation_error_response({field: [f'{field.capitalize()} already exists']})
             return error_response('An account with that email or username already exists.', status=409)
         except Exception as e:
             logger.error(f'Registration error: {str(e)}')
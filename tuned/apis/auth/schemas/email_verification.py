@@ -4,7 +4,7 @@ from typing import Any
 
 
 class EmailVerifyResendSchema(Schema):
-    email = fields.Email(required=True, error_messages={
+    email = fields.Str(required=True, error_messages={
         'required': 'Email address is required.',
         'invalid': 'Please provide a valid email address.',
     })
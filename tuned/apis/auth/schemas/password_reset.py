@@ -4,7 +4,7 @@ from typing import Any
 
 
 class PasswordResetRequestSchema(Schema):
-    email = fields.Email(required=True)
+    email = fields.Str(required=True)
     
     @validates('email')
     def validate_email_field(self, value: str, **kwargs: Any) -> None:
@@ -1,12 +1,11 @@
 from marshmallow import Schema, fields, validates, validates_schema, ValidationError, pre_load
 from marshmallow.validate import Length
 from typing import Any
-from tuned.models.user import User
 from tuned.utils.validators import validate_email, validate_password_strength, validate_username, validate_phone_number
 
 class RegistrationSchema(Schema):
     username = fields.Str(required=True, validate=Length(min=3))
-    email = fields.Email(required=True)
+    email = fields.Str(required=True)
     password = fields.Str(required=True, load_only=True, validate=Length(min=8))
     confirm_password = fields.Str(required=True, load_only=True)
     first_name = fields.String(required=True)
@@ -38,17 +37,11 @@ class RegistrationSchema(Schema):
         is_valid, error = validate_username(value)
         if not is_valid:
             raise ValidationError(error or "Invalid username")
-        
-        if User.query.filter_by(username=value).first():
-            raise ValidationError('Username already exists')
     
     @validates('email')
     def validate_email_field(self, value: str, **kwargs: Any) -> None:
         if not validate_email(value):
             raise ValidationError('Invalid email format')
-        
-        if User.query.filter_by(email=value).first():
-            raise ValidationError('Email already exists')
     
     @validates('password')
     def validate_password_field(self, value: str, **kwargs: Any) -> None:
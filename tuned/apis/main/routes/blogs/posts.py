@@ -20,6 +20,8 @@ CACHE_KEY = 'blogs:all'
 CACHE_TTL = 300
 
 class ListBlogPosts(MethodView):
+    init_every_request = False
+
     def __init__(self) -> None:
         self._schema = BlogFilterSchema()
 
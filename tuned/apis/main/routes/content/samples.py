@@ -19,6 +19,8 @@ CACHE_KEY_SAMPLES = 'samples:list'
 
 
 class SampleListView(MethodView):
+    init_every_request = False
+
     def __init__(self) -> None:
         self._schema = SampleFilterSchema()
 
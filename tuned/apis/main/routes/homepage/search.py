@@ -17,6 +17,8 @@ from tuned.core.logging import get_logger
 logger: logging.Logger = get_logger(__name__)
 
 class GlobalSearchView(MethodView):
+    init_every_request = False
+
     def __init__(self) -> None:
         self._schema = SearchQuerySchema()
 
@@ -1,7 +1,10 @@
 from marshmallow import Schema, fields, validate, validates, ValidationError
 from typing import Any, Optional
+from collections import Counter
 import re
 
+_LINK_RE = re.compile(r'https?://')
+
 class BlogFilterSchema(Schema):
     category_id: fields.Str = fields.Str(
         required=False,
@@ -102,16 +105,13 @@ class BlogCommentSchema(Schema):
     
     @validates('content')
     def validate_content_text(self, value: str, **kwargs: Any) -> str:
-        link_count = len(re.findall(r'http[s]?://', value))
+        link_count = len(_LINK_RE.findall(value))
         if link_count > 3:
             raise ValidationError('Comment appears to be spam (too many links)')
         
         words = value.lower().split()
         if len(words) > 10:
-            word_freq: dict[str, int] = {}
-            for word in words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-            max_freq = max(word_freq.values())
+            max_freq = Counter(words).most_common(1)[0][1]
             if max_freq > len(words) * 0.5:  # More than 50% repetition
                 raise ValidationError('Comment appears to be spam (excessive repetition)')
         
@@ -4,6 +4,9 @@ import re
 
 from typing import Any
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DISPOSABLE_DOMAINS = frozenset({'tempmail.com', 'throwaway.email', '10minutemail.com'})
+
 class NewsletterSubscribeSchema(Schema):
     email = fields.Email(
         required=True,
@@ -27,13 +30,11 @@ class NewsletterSubscribeSchema(Schema):
     
     @validates('email')
     def validate_email(self, value: str, **kwargs: Any) -> str:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
+        if not _EMAIL_RE.match(value):
             raise ValidationError('Invalid email address format')
         
-        disposable_domains = ['tempmail.com', 'throwaway.email', '10minutemail.com']
-        domain = value.split('@')[1].lower()
-        if domain in disposable_domains:
+        domain = value.rpartition('@')[2].lower()
+        if domain in _DISPOSABLE_DOMAINS:
             raise ValidationError('Disposable email addresses are not allowed')
         
         return value
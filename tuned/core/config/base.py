@@ -14,6 +14,7 @@ class BaseConfig:
     LOG_FORMAT: Literal["text", "json"] = "json"
     
     REQUIRE_EMAIL_VERIFICATION: bool = True
+    TESTING_FAST_HASH: bool = False
 
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
     SQLALCHEMY_RECORD_QUERIES: bool = True
@@ -9,6 +9,7 @@ class TestingConfig(BaseConfig):
     # JWT_COOKIE_CSRF_PROTECT: bool = False
     PERMANENT_SESSION_LIFETIME: timedelta = timedelta(minutes=5)
     MAIL_SUPPRESS_SEND: bool = True
+    TESTING_FAST_HASH: bool = True
     SESSION_COOKIE_SECURE: bool = False
     REMEMBER_COOKIE_SECURE: bool = False
     # JWT_COOKIE_SECURE: bool = False
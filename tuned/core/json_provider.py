@@ -0,0 +1,41 @@
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Dates and dataclasses still go through Flask's ``default`` (RFC 822
+    strings, ``asdict``), as do Decimals. Calls orjson cannot honour fall
+    back to the stdlib implementation.
+
+    Unlike ``DefaultJSONProvider``, output is always UTF-8 (``ensure_ascii``
+    is ignored) and NaN or infinite floats serialize as ``null``.
+    """
+
+    _OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    _STDLIB_ONLY_KWARGS = frozenset({'cls', 'allow_nan', 'check_circular', 'skipkeys'})
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if self._STDLIB_ONLY_KWARGS.intersection(kwargs):
+            return super().dumps(obj, **kwargs)
+
+        option = self._OPTIONS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -40,9 +40,8 @@ class AnalyticsService:
 
     def get_nav_stats(self, user_id: str) -> NavStatsDTO:
         try:
-            active_orders = self._order_repo.get_active_orders(user_id)
             return NavStatsDTO(
-                active_orders=len(active_orders),
+                active_orders=self._order_repo.count_active_orders(user_id),
                 balance=0.0,
             )
         except DatabaseError:
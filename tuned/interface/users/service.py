@@ -6,11 +6,12 @@ import os
 import uuid
 from flask_login import login_user
 from flask import current_app
-from werkzeug.security import generate_password_hash
+from tuned.utils.auth.password import make_password_hash
 from werkzeug.utils import secure_filename
 from dataclasses import asdict
 
 from tuned.core.exceptions import AlreadyExists, DatabaseError, NotFound, InvalidCredentials, ServiceError
+from tuned.repository.exceptions import AlreadyExists as RepositoryAlreadyExists
 from tuned.dtos import (
     CreateUserDTO, LoginRequestDTO, UserResponseDTO, UpdateUserDTO,
     ActivityLogCreateDTO, EmailVerificationResendDTO, EmailVerifyConfirmDTO,
@@ -90,7 +91,8 @@ class UserService:
                 raise
 
             return {'email': created_user.email}
-        except AlreadyExists as e:
+        except (AlreadyExists, RepositoryAlreadyExists) as e:
+            self._repo.rollback()
             raise e
         except ServiceError as e:
             raise e
@@ -219,7 +221,7 @@ class UserService:
         if not user.check_password(data.current_password):
             raise InvalidCredentials("Invalid current password.")
             
-        new_hash = generate_password_hash(data.new_password)
+        new_hash = make_password_hash(data.new_password)
         _ = self._repo.update_user(
             UpdateUserDTO(user_id=user_id, password_hash=new_hash),
             actor_id=user_id
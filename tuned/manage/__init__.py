@@ -11,6 +11,7 @@ from tuned.manage.commands import (
     seed_db,
     manage_tables,
     create_payment_methods,
+    dedupe_users,
 )
 from typing import Any, Union
 from flask import Blueprint, Flask
@@ -30,5 +31,6 @@ def register_cli_commands(app: Union[Flask, Blueprint]) -> None:
     app.cli.add_command(seed_db)
     app.cli.add_command(manage_tables)
     app.cli.add_command(create_payment_methods)
+    app.cli.add_command(dedupe_users)
 
 register_cli_commands(manage_bp)
\ No newline at end of file
@@ -10,6 +10,7 @@ from tuned.manage.commands.create_blogs import create_blogs
 from tuned.manage.commands.seed_db import seed_db
 from tuned.manage.commands.manage_tables import manage_tables
 from tuned.manage.commands.create_payment_methods import create_payment_methods
+from tuned.manage.commands.dedupe_users import dedupe_users
 
 __all__ = [
     "create_superuser",
@@ -24,4 +25,5 @@ __all__ = [
     "seed_db",
     "manage_tables",
     "create_payment_methods",
+    "dedupe_users",
 ]
@@ -0,0 +1,94 @@
+import logging
+from itertools import groupby
+from typing import Any
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, select
+
+from tuned.extensions import db
+from tuned.models.user import User
+from tuned.core.logging import get_logger
+
+logger: logging.Logger = get_logger(__name__)
+
+# Created by db.create_all() on fresh databases; existing ones need them added here
+CASE_INSENSITIVE_INDEXES = ("ix_users_lower_email", "ix_users_lower_username")
+
+
+def _case_duplicates(column: Any) -> list[list[User]]:
+    lowered = func.lower(column)
+    taken_twice = select(lowered).group_by(lowered).having(func.count() > 1)
+    users = db.session.scalars(
+        select(User)
+        .where(lowered.in_(taken_twice))
+        .order_by(lowered, User.created_at, User.id)
+    ).all()
+    return [
+        list(group)
+        for _, group in groupby(users, key=lambda u: getattr(u, column.key).lower())
+    ]
+
+
+def _renamed_username(user: User) -> str:
+    return f"{user.username[:55]}_{user.id.hex[:8]}"
+
+
+def _renamed_email(user: User) -> str:
+    local, _, domain = user.email.rpartition("@")
+    return f"{local[:100]}+dup-{user.id.hex[:8]}@{domain}"
+
+
+def _create_indexes() -> None:
+    for index in User.__table__.indexes:
+        if index.name in CASE_INSENSITIVE_INDEXES:
+            index.create(db.engine, checkfirst=True)
+            click.echo(f"  ✓ Index {index.name} in place")
+
+
+@click.command("dedupe-users")
+@click.option("--fix", is_flag=True, default=False,
+              help="Rename the newer account in each duplicate group, then create the indexes.")
+@click.option("--yes", "-y", is_flag=True, default=False,
+              help="Skip confirmation prompts (use with caution).")
+@with_appcontext
+def dedupe_users(fix: bool, yes: bool) -> None:
+    fields = (
+        ("email", User.email, _renamed_email),
+        ("username", User.username, _renamed_username),
+    )
+    found = {name: _case_duplicates(column) for name, column, _ in fields}
+
+    for name, groups in found.items():
+        for group in groups:
+            values = ", ".join(f"{getattr(u, name)} ({u.id})" for u in group)
+            click.echo(f"  ⚠ Case-variant {name}: {values}")
+
+    total = sum(len(groups) for groups in found.values())
+    click.echo(f"\nDuplicate groups: {total}")
+
+    if not fix:
+        if total:
+            click.echo("Run with --fix before creating the case-insensitive indexes.")
+        return
+
+    if total and not yes:
+        click.confirm(
+            "⚠  This renames every account but the oldest in each group. Continue?",
+            abort=True,
+        )
+
+    try:
+        for name, _, rename in fields:
+            for group in found[name]:
+                for user in group[1:]:
+                    new_value = rename(user)
+                    click.echo(f"  ✓ {name} {getattr(user, name)} → {new_value}")
+                    setattr(user, name, new_value)
+                    if name == "email":
+                        user.email_verified = False
+        db.session.commit()
+        _create_indexes()
+    except Exception as exc:
+        db.session.rollback()
+        logger.exception("Failed to dedupe users")
+        click.echo(f"✗ Error deduplicating users: {exc}")
@@ -39,6 +39,8 @@ class OrderDeadlineExtensionRequest(BaseModel):
     __table_args__ = (
         db.Index('ix_extension_request_order_status', 'order_id', 'status'),
         db.Index('ix_extension_request_created', 'requested_at'),
+        db.Index('ix_extension_request_order_requested', 'order_id', 'requested_at'),
+        db.Index('ix_extension_request_status_requested', 'status', 'requested_at'),
     )
     
     @validates('status')
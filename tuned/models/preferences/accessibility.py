@@ -4,6 +4,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING, Any
 from decimal import Decimal
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 from tuned.extensions import db
 
 if TYPE_CHECKING:
@@ -38,19 +39,24 @@ class UserAccessibilityPreferences(BaseModel):
     
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='accessibility_preferences')
     
+    _DICT_FIELDS = (
+        'font_size_multiplier',
+        'text_spacing_increased',
+        'high_contrast_mode',
+        'color_blind_mode',
+        'reduced_motion',
+        'screen_reader_optimized',
+        'keyboard_navigation_enhanced',
+        'focus_indicators_enhanced',
+        'created_at',
+        'updated_at',
+    )
+    _DICT_DEFAULTS: dict[str, Any] = {
+        'font_size_multiplier': 1.0
+    }
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'font_size_multiplier': float(self.font_size_multiplier) if self.font_size_multiplier else 1.0,
-            'text_spacing_increased': self.text_spacing_increased,
-            'high_contrast_mode': self.high_contrast_mode,
-            'color_blind_mode': self.color_blind_mode,
-            'reduced_motion': self.reduced_motion,
-            'screen_reader_optimized': self.screen_reader_optimized,
-            'keyboard_navigation_enhanced': self.keyboard_navigation_enhanced,
-            'focus_indicators_enhanced': self.focus_indicators_enhanced,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f), self._DICT_DEFAULTS.get(f)) for f in self._DICT_FIELDS}
 
     def __init__(self, **kwargs: Any) -> None:
         super(UserAccessibilityPreferences, self).__init__(**kwargs)
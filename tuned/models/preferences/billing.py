@@ -6,6 +6,7 @@ from decimal import Decimal
 from tuned.extensions import db
 from tuned.models.enums import InvoiceDeliveryMethod
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 
 if TYPE_CHECKING:
     from tuned.models.user import User
@@ -36,17 +37,22 @@ class UserBillingPreferences(BaseModel):
     
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='billing_preferences')
     
+    _DICT_FIELDS = (
+        'invoice_email',
+        'invoice_delivery',
+        'payment_reminders',
+        'reminder_days_before',
+        'auto_reload_enabled',
+        'auto_reload_threshold',
+        'created_at',
+        'updated_at',
+    )
+    _DICT_DEFAULTS: dict[str, Any] = {
+        'invoice_delivery': 'email'
+    }
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'invoice_email': self.invoice_email,
-            'invoice_delivery': self.invoice_delivery.value if self.invoice_delivery else 'email',
-            'payment_reminders': self.payment_reminders,
-            'reminder_days_before': self.reminder_days_before,
-            'auto_reload_enabled': self.auto_reload_enabled,
-            'auto_reload_threshold': float(self.auto_reload_threshold) if self.auto_reload_threshold else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f), self._DICT_DEFAULTS.get(f)) for f in self._DICT_FIELDS}
     
     def __init__(self, **kwargs: Any) -> None:
         super(UserBillingPreferences, self).__init__(**kwargs)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional, Any
 from tuned.extensions import db
 from tuned.models.enums import EmailFrequency
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 
 if TYPE_CHECKING:
     from tuned.models.user import User
@@ -57,19 +58,24 @@ class UserEmailPreferences(BaseModel):
     
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='email_preferences')
     
+    _DICT_FIELDS = (
+        'newsletter',
+        'promotional_emails',
+        'product_updates',
+        'order_confirmations',
+        'payment_receipts',
+        'account_security',
+        'frequency',
+        'daily_digest_hour',
+        'created_at',
+        'updated_at',
+    )
+    _DICT_DEFAULTS: dict[str, Any] = {
+        'frequency': 'instant'
+    }
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'newsletter': self.newsletter,
-            'promotional_emails': self.promotional_emails,
-            'product_updates': self.product_updates,
-            'order_confirmations': self.order_confirmations,
-            'payment_receipts': self.payment_receipts,
-            'account_security': self.account_security,
-            'frequency': self.frequency.value if self.frequency else 'instant',
-            'daily_digest_hour': self.daily_digest_hour,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f), self._DICT_DEFAULTS.get(f)) for f in self._DICT_FIELDS}
     
     def __init__(self, **kwargs: Any) -> None:
         super(UserEmailPreferences, self).__init__(**kwargs)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional, Any
 from tuned.extensions import db
 from tuned.models.enums import DateFormat, TimeFormat, NumberFormat, WeekStart
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 
 if TYPE_CHECKING:
     from tuned.models.user import User
@@ -51,19 +52,27 @@ class UserLocalizationSettings(BaseModel):
         
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='localization_settings')
     
+    _DICT_FIELDS = (
+        'language',
+        'country_code',
+        'timezone',
+        'date_format',
+        'time_format',
+        'currency',
+        'number_format',
+        'week_start',
+        'created_at',
+        'updated_at',
+    )
+    _DICT_DEFAULTS: dict[str, Any] = {
+        'date_format': 'MM/DD/YYYY',
+        'time_format': '12h',
+        'number_format': '1,234.56',
+        'week_start': 'sunday'
+    }
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'language': self.language,
-            'country_code': self.country_code,
-            'timezone': self.timezone,
-            'date_format': self.date_format.value if self.date_format else 'MM/DD/YYYY',
-            'time_format': self.time_format.value if self.time_format else '12h',
-            'currency': self.currency,
-            'number_format': self.number_format.value if self.number_format else '1,234.56',
-            'week_start': self.week_start.value if self.week_start else 'sunday',
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f), self._DICT_DEFAULTS.get(f)) for f in self._DICT_FIELDS}
     
     def __init__(self, **kwargs: Any) -> None:
         super(UserLocalizationSettings, self).__init__(**kwargs)
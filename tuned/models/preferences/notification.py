@@ -3,6 +3,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING, Any
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 from tuned.extensions import db
 
 if TYPE_CHECKING:
@@ -36,23 +37,25 @@ class UserNotificationPreferences(BaseModel):
         
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='notification_preferences')
     
+    _DICT_FIELDS = (
+        'email_notifications',
+        'sms_notifications',
+        'push_notifications',
+        'order_updates',
+        'payment_notifications',
+        'delivery_notifications',
+        'revision_updates',
+        'extension_updates',
+        'comment_notifications',
+        'support_ticket_updates',
+        'marketing_emails',
+        'weekly_summary',
+        'created_at',
+        'updated_at',
+    )
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'email_notifications': self.email_notifications,
-            'sms_notifications': self.sms_notifications,
-            'push_notifications': self.push_notifications,
-            'order_updates': self.order_updates,
-            'payment_notifications': self.payment_notifications,
-            'delivery_notifications': self.delivery_notifications,
-            'revision_updates': self.revision_updates,
-            'extension_updates': self.extension_updates,
-            'comment_notifications': self.comment_notifications,
-            'support_ticket_updates': self.support_ticket_updates,
-            'marketing_emails': self.marketing_emails,
-            'weekly_summary': self.weekly_summary,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f)) for f in self._DICT_FIELDS}
     
     def __init__(self, **kwargs: Any) -> None:
         super(UserNotificationPreferences, self).__init__(**kwargs)
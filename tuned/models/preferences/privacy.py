@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 from tuned.extensions import db
 from tuned.models.enums import ProfileVisibility
 from tuned.models.base import BaseModel
+from tuned.models.utils import serialize_value
 
 if TYPE_CHECKING:
     from tuned.models.user import User
@@ -40,21 +41,26 @@ class UserPrivacySettings(BaseModel):
     
     user: Mapped["User"] = relationship('User', foreign_keys=[user_id], back_populates='privacy_settings')
     
+    _DICT_FIELDS = (
+        'profile_visibility',
+        'show_email',
+        'show_phone',
+        'show_name',
+        'allow_messages',
+        'allow_comments',
+        'data_sharing',
+        'analytics_tracking',
+        'third_party_cookies',
+        'allow_search_engine_indexing',
+        'created_at',
+        'updated_at',
+    )
+    _DICT_DEFAULTS: dict[str, Any] = {
+        'profile_visibility': 'private'
+    }
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            'profile_visibility': self.profile_visibility.value if self.profile_visibility else 'private',
-            'show_email': self.show_email,
-            'show_phone': self.show_phone,
-            'show_name': self.show_name,
-            'allow_messages': self.allow_messages,
-            'allow_comments': self.allow_comments,
-            'data_sharing': self.data_sharing,
-            'analytics_tracking': self.analytics_tracking,
-            'third_party_cookies': self.third_party_cookies,
-            'allow_search_engine_indexing': self.allow_search_engine_indexing,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return {f: serialize_value(getattr(self, f), self._DICT_DEFAULTS.get(f)) for f in self._DICT_FIELDS}
     
     def __init__(self, **kwargs: Any) -> None:
         super(UserPrivacySettings, self).__init__(**kwargs)
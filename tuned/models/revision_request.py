@@ -42,6 +42,7 @@ class OrderRevisionRequest(BaseModel):
     __table_args__ = (
         db.Index('ix_revision_request_order_status', 'order_id', 'status'),
         db.Index('ix_revision_request_created', 'requested_at'),
+        db.Index('ix_revision_request_order_requested', 'order_id', 'requested_at'),
     )
     
     @validates('status')
@@ -2,7 +2,7 @@ from sqlalchemy.dialects.postgresql import ENUM, UUID
 from datetime import datetime
 from flask import url_for 
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 from tuned.extensions import db
 from tuned.models.base import BaseModel
 from tuned.models.communication import ChatMessage, Chat
@@ -64,6 +64,11 @@ class User(UserMixin, BaseModel):  # type: ignore[misc]
     language: Mapped[Optional[str]] = mapped_column(db.String(10), default='en', nullable=True)  # ISO 639-1
     timezone: Mapped[Optional[str]] = mapped_column(db.String(50), default='UTC', nullable=True)  # IANA timezone
     
+    __table_args__ = (
+        db.Index('ix_users_lower_email', db.func.lower(email), unique=True),
+        db.Index('ix_users_lower_username', db.func.lower(username), unique=True),
+    )
+    
     # Relationships
     orders: Mapped[list["Order"]] = relationship('Order', foreign_keys='Order.client_id', back_populates='client', lazy=True)
     referrals: Mapped[list["Referral"]] = relationship('Referral', foreign_keys='Referral.referrer_id', back_populates='referrer', lazy=True)
@@ -105,7 +110,8 @@ class User(UserMixin, BaseModel):  # type: ignore[misc]
         return ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(10))
     
     def set_password(self: 'User', password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        from tuned.utils.auth.password import make_password_hash
+        self.password_hash = make_password_hash(password)
 
     def check_password(self: 'User', password: str) -> bool:
         return check_password_hash(self.password_hash, password)
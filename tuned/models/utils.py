@@ -1,16 +1,22 @@
 import re
 import unicodedata
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.scoping import scoped_session
 from sqlalchemy import select
 
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[-\s]+")
+
 def generate_slug(title: str, model: Any, session: Union[Session, scoped_session[Any]], max_length: int = 100) -> str:
     normalized = unicodedata.normalize("NFKD", title)
     ascii_title = normalized.encode("ascii", "ignore").decode("ascii")
 
-    base_slug = re.sub(r"[^\w\s-]", "", ascii_title.lower())
-    base_slug = re.sub(r"[-\s]+", "-", base_slug).strip("-")
+    base_slug = _SLUG_STRIP_RE.sub("", ascii_title.lower())
+    base_slug = _SLUG_SEPARATOR_RE.sub("-", base_slug).strip("-")
     base_slug = base_slug[:max_length].strip("-")
 
     if not base_slug:
@@ -23,4 +29,15 @@ def generate_slug(title: str, model: Any, session: Union[Session, scoped_session
         slug = f"{base_slug[:max_length - len(suffix)]}{suffix}"
         counter += 1
 
-    return slug
\ No newline at end of file
+    return slug
+
+def serialize_value(value: Any, default: Any = None) -> Any:
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
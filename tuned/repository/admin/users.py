@@ -109,7 +109,7 @@ class GetAdminUserList:
             stmt = stmt.order_by(order_fn(sort_col))
 
             # Count total
-            count_stmt = select(func.count()).select_from(stmt.subquery())
+            count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
             total = self.session.scalar(count_stmt) or 0
 
             # Pagination
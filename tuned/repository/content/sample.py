@@ -96,7 +96,7 @@ def getSampleListResponse(
     stmt = stmt.order_by(order_func(sort_field))
 
     # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
     total = session.execute(count_stmt).scalar() or 0
 
     page = max(req.page or 1, 1)
@@ -81,7 +81,7 @@ class GetApprovedTestimonialsPaginated:
             stmt = stmt.order_by(Testimonial.created_at.desc())
             
             # Count total
-            count_stmt = select(func.count()).select_from(stmt.subquery())
+            count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
             total = self.session.scalar(count_stmt) or 0
             
             # Paginate
@@ -209,7 +209,7 @@ class ListAllTestimonials:
             order_func = asc if req.order == "asc" else desc
             stmt = stmt.order_by(order_func(sort_field))
 
-            count_stmt = select(func.count()).select_from(stmt.subquery())
+            count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
             total = self.session.scalar(count_stmt) or 0
 
             page, per_page = max(req.page or 1, 1), min(req.per_page or 10, 100)
@@ -127,6 +127,24 @@ class GetActiveOrdersByClient:
             logger.error("[GetActiveOrdersByClient] DB error: %s", exc)
             raise DatabaseError(str(exc)) from exc
 
+class CountActiveOrdersByClient:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def execute(self, client_id: str) -> int:
+        try:
+            stmt = (
+                select(func.count(Order.id))
+                .where(
+                    Order.client_id == client_id,
+                    Order.status.in_(_ACTIVE_STATUSES),
+                )
+            )
+            return self.session.scalar(stmt) or 0
+        except SQLAlchemyError as exc:
+            logger.error("[CountActiveOrdersByClient] DB error: %s", exc)
+            raise DatabaseError(str(exc)) from exc
+
 class GetOrderById:
     def __init__(self, session: Session) -> None:
         self.session = session
@@ -338,7 +356,7 @@ def getOrderListResponse(
 
     stmt = stmt.order_by(order_func(sort_field))
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
     total = session.execute(count_stmt).scalar() or 0
 
     page = max(req.page or 1, 1)
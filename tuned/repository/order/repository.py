@@ -19,6 +19,7 @@ from tuned.repository.order.files import (
 )
 from tuned.repository.order.orders import(
     GetActiveOrdersByClient,
+    CountActiveOrdersByClient,
     GetOrderById,
     GetLatestActiveOrderByClient,
     GetUpcomingDeadlines,
@@ -54,6 +55,9 @@ class OrderRepository(OrderRepositoryProtocol):
     def get_active_orders(self, client_id: str) -> list[Order]:
         return GetActiveOrdersByClient(self.session).execute(client_id)
 
+    def count_active_orders(self, client_id: str) -> int:
+        return CountActiveOrdersByClient(self.session).execute(client_id)
+
     def get_paid_order_count(self, client_id: str) -> int:
         stmt = (
             select(func.count(Order.id))
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 class OrderRepositoryProtocol(Protocol):
     def get_by_id(self, order_id: str) -> Order: ...
     def get_active_orders(self, client_id: str) -> Sequence["Order"]: ...
+    def count_active_orders(self, client_id: str) -> int: ...
     def get_paid_order_count(self, client_id: str) -> int: ...
     def get_latest_active_order(self, client_id: str) -> Optional["Order"]: ...
     def get_upcoming_deadlines(self, client_id: str, limit: int = 3) -> Sequence["Order"]: ...
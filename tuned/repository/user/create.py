@@ -40,6 +40,6 @@ class CreateUser:
 
             return new_user
         except IntegrityError as e:
-            raise AlreadyExists("User already exists")
+            raise AlreadyExists("User already exists") from e
         except SQLAlchemyError as e:
             raise DatabaseError("Database error while creating user") from e
\ No newline at end of file
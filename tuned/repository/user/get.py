@@ -1,5 +1,5 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import func, select
 from tuned.models import User
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -30,7 +30,7 @@ class GetUserByEmail:
 
     def execute(self, email: str) -> User:
         try:
-            stmt = select(User).where(User.email == email)
+            stmt = select(User).where(func.lower(User.email) == email.lower())
             user = self.session.scalar(stmt)
             if not user:
                 raise NotFound("User not found")
@@ -44,7 +44,7 @@ class GetUserByUsername:
 
     def execute(self, username: str) -> User:
         try:
-            stmt = select(User).where(User.username.ilike(f"%{username}%"))
+            stmt = select(User).where(func.lower(User.username) == username.lower())
             user = self.session.scalar(stmt)
             if not user:
                 raise NotFound("User not found")
@@ -1,6 +1,9 @@
+import uuid
 from datetime import datetime, timezone
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Tuple, Any
 from flask import current_app
+from sqlalchemy import exists, lambda_stmt, select, update
+from sqlalchemy.orm import raiseload, selectinload
 from tuned.extensions import db
 from tuned.models.user import User
 from tuned.models.preferences import (
@@ -17,62 +20,119 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_CATEGORY_MODELS: Dict[str, Any] = {
+    'notification': UserNotificationPreferences,
+    'email': UserEmailPreferences,
+    'privacy': UserPrivacySettings,
+    'localization': UserLocalizationSettings,
+    'accessibility': UserAccessibilityPreferences,
+    'billing': UserBillingPreferences
+}
 
-def initialize_user_preferences(user_id: int) -> Dict[str, Any]:
+# Owner and audit columns, left untouched by reset_preferences_to_defaults
+_BOOKKEEPING_COLUMNS = frozenset({
+    'id', 'user_id',
+    'created_at', 'created_by', 'updated_at', 'updated_by',
+    'is_deleted', 'deleted_at', 'deleted_by'
+})
+
+
+def _column_defaults(model: Any) -> Dict[str, Any]:
+    # Only plain values can go into update().values(); nullable columns without a default reset to NULL
+    defaults: Dict[str, Any] = {}
+    for column in model.__table__.columns:
+        if column.key in _BOOKKEEPING_COLUMNS:
+            continue
+        default = column.default
+        if default is not None and default.is_scalar:
+            defaults[column.key] = default.arg
+        elif default is None and column.nullable:
+            defaults[column.key] = None
+        else:
+            raise ValueError(
+                f"{model.__name__}.{column.key} needs a scalar default "
+                f"to be reset by reset_preferences_to_defaults"
+            )
+    return defaults
+
+
+# Taken from the model column defaults; applied by reset_preferences_to_defaults
+_DEFAULTS: Dict[Any, Dict[str, Any]] = {
+    model: _column_defaults(model) for model in _CATEGORY_MODELS.values()
+}
+
+
+def _get_user_with_preferences(user_id: uuid.UUID | str) -> Optional[User]:
+    # lambda_stmt caches the compiled SQL per call site; user_id becomes a bound parameter
+    stmt = lambda_stmt(lambda: select(User).options(
+        selectinload(User.notification_preferences),
+        selectinload(User.email_preferences),
+        selectinload(User.privacy_settings),
+        selectinload(User.localization_settings),
+        selectinload(User.accessibility_preferences),
+        selectinload(User.billing_preferences)
+    ))
+    stmt += lambda s: s.where(User.id == user_id)
+    # Fail loudly on any relationship access the options above don't cover
+    if current_app.config.get('SQLALCHEMY_RAISELOAD', False):
+        stmt += lambda s: s.options(raiseload('*'))
+    return db.session.execute(stmt).scalar_one_or_none()
+
+
+def _get_user_and_preferences(user_id: uuid.UUID | str) -> Optional[Tuple[Any, ...]]:
+    # The six categories are one-to-one with User, so LEFT OUTER JOINs return a single row
+    stmt = lambda_stmt(lambda: select(
+        User,
+        UserNotificationPreferences,
+        UserEmailPreferences,
+        UserPrivacySettings,
+        UserLocalizationSettings,
+        UserAccessibilityPreferences,
+        UserBillingPreferences
+    )
+        .outerjoin(UserNotificationPreferences, UserNotificationPreferences.user_id == User.id)
+        .outerjoin(UserEmailPreferences, UserEmailPreferences.user_id == User.id)
+        .outerjoin(UserPrivacySettings, UserPrivacySettings.user_id == User.id)
+        .outerjoin(UserLocalizationSettings, UserLocalizationSettings.user_id == User.id)
+        .outerjoin(UserAccessibilityPreferences, UserAccessibilityPreferences.user_id == User.id)
+        .outerjoin(UserBillingPreferences, UserBillingPreferences.user_id == User.id)
+    )
+    stmt += lambda s: s.where(User.id == user_id)
+    row = db.session.execute(stmt).one_or_none()
+    return tuple(row) if row else None
+
+
+def initialize_user_preferences(user_id: uuid.UUID | str) -> Dict[str, Any]:
     result: Dict[str, Any] = {}
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     
     if not user:
         logger.error(f"Cannot initialize preferences: User {user_id} not found")
         return {'success': False, 'error': 'User not found'}
     
     try:
-        if not user.notification_preferences:
-            notif_prefs = UserNotificationPreferences(user_id=user_id)
-            db.session.add(notif_prefs)
-            result['notification'] = True
-        else:
-            result['notification'] = False
-        
-        if not user.email_preferences:
-            email_prefs = UserEmailPreferences(user_id=user_id)
-            db.session.add(email_prefs)
-            result['email'] = True
-        else:
-            result['email'] = False
-        
-        if not user.privacy_settings:
-            privacy_settings = UserPrivacySettings(user_id=user_id)
-            db.session.add(privacy_settings)
-            result['privacy'] = True
-        else:
-            result['privacy'] = False
-        
-        if not user.localization_settings:
-            localization = UserLocalizationSettings(
-                user_id=user_id,
-                language=user.language or 'en',
-                timezone=user.timezone or 'UTC'
-            )
-            db.session.add(localization)
-            result['localization'] = True
-        else:
-            result['localization'] = False
-        
-        if not user.accessibility_preferences:
-            accessibility = UserAccessibilityPreferences(user_id=user_id)
-            db.session.add(accessibility)
-            result['accessibility'] = True
-        else:
-            result['accessibility'] = False
-        
-        if not user.billing_preferences:
-            billing = UserBillingPreferences(user_id=user_id)
-            db.session.add(billing)
-            result['billing'] = True
-        else:
-            result['billing'] = False
-        
+        # One round-trip answers "does this category exist?" for all six tables
+        existing = db.session.execute(select(*(
+            exists().where(model.user_id == user_id)
+            for model in _CATEGORY_MODELS.values()
+        ))).one()
+        
+        pending: List[Any] = []
+        
+        for (name, model), found in zip(_CATEGORY_MODELS.items(), existing):
+            result[name] = not found
+            if not result[name]:
+                continue
+            if model is UserLocalizationSettings:
+                pending.append(model(
+                    user_id=user_id,
+                    language=user.language or 'en',
+                    timezone=user.timezone or 'UTC'
+                ))
+            else:
+                pending.append(model(user_id=user_id))
+        
+        db.session.add_all(pending)
         db.session.commit()
         
         result['success'] = True
@@ -86,8 +146,8 @@ def initialize_user_preferences(user_id: int) -> Dict[str, Any]:
         return {'success': False, 'error': str(e)}
 
 
-def get_all_user_preferences(user_id: int, lazy_init: bool = True) -> Optional[Dict[str, Any]]:
-    user = User.query.get(user_id)
+def get_all_user_preferences(user_id: uuid.UUID | str, lazy_init: bool = True) -> Optional[Dict[str, Any]]:
+    user = _get_user_with_preferences(user_id)
     
     if not user:
         logger.warning(f"User {user_id} not found")
@@ -107,7 +167,9 @@ def get_all_user_preferences(user_id: int, lazy_init: bool = True) -> Optional[D
         if needs_init:
             logger.info(f"Lazy-initializing missing preferences for user {user_id}")
             initialize_user_preferences(user_id)
-            db.session.refresh(user)
+            user = _get_user_with_preferences(user_id)
+            if not user:
+                return None
     
     return {
         'notification': user.notification_preferences.to_dict() if user.notification_preferences else None,
@@ -119,13 +181,26 @@ def get_all_user_preferences(user_id: int, lazy_init: bool = True) -> Optional[D
     }
 
 
-def export_user_preferences(user_id: int) -> Optional[Dict[str, Any]]:
-    user = User.query.get(user_id)
+def export_user_preferences(user_id: uuid.UUID | str) -> Optional[Dict[str, Any]]:
+    row = _get_user_and_preferences(user_id)
     
-    if not user:
+    if not row:
         return None
     
-    preferences = get_all_user_preferences(user_id, lazy_init=True)
+    user, *prefs = row
+    
+    # Lazy initialization if any preferences are missing
+    if any(pref is None for pref in prefs):
+        initialize_user_preferences(user_id)
+        row = _get_user_and_preferences(user_id)
+        if not row:
+            return None
+        user, *prefs = row
+    
+    preferences = {
+        name: pref.to_dict() if pref else None
+        for name, pref in zip(_CATEGORY_MODELS, prefs)
+    }
     
     export_data = {
         'export_metadata': {
@@ -160,8 +235,8 @@ def export_user_preferences(user_id: int) -> Optional[Dict[str, Any]]:
     return export_data
 
 
-def import_user_preferences(user_id: int, import_data: Dict[str, Any]) -> Dict[str, Any]:
-    user = User.query.get(user_id)
+def import_user_preferences(user_id: uuid.UUID | str, import_data: Dict[str, Any]) -> Dict[str, Any]:
+    user = db.session.get(User, user_id)
     
     if not user:
         return {'success': False, 'error': 'User not found'}
@@ -247,46 +322,30 @@ def import_user_preferences(user_id: int, import_data: Dict[str, Any]) -> Dict[s
         return {'success': False, 'error': str(e)}
 
 
-def reset_preferences_to_defaults(user_id: int, category: Optional[str] = None) -> Dict[str, Any]:
-    user = User.query.get(user_id)
+def reset_preferences_to_defaults(user_id: uuid.UUID | str, category: Optional[str] = None) -> Dict[str, Any]:
+    snapshot = export_user_preferences(user_id)
     
-    if not user:
+    if not snapshot:
         return {'success': False, 'error': 'User not found'}
     
     try:
-        snapshot = export_user_preferences(user_id)
-        
         reset_categories = []
-        
-        if category is None or category == 'notification':
-            if user.notification_preferences:
-                db.session.delete(user.notification_preferences)
-                reset_categories.append('notification')
-        
-        if category is None or category == 'email':
-            if user.email_preferences:
-                db.session.delete(user.email_preferences)
-                reset_categories.append('email')
-        
-        if category is None or category == 'privacy':
-            if user.privacy_settings:
-                db.session.delete(user.privacy_settings)
-                reset_categories.append('privacy')
-        
-        if category is None or category == 'localization':
-            if user.localization_settings:
-                db.session.delete(user.localization_settings)
-                reset_categories.append('localization')
-        
-        if category is None or category == 'accessibility':
-            if user.accessibility_preferences:
-                db.session.delete(user.accessibility_preferences)
-                reset_categories.append('accessibility')
-        
-        if category is None or category == 'billing':
-            if user.billing_preferences:
-                db.session.delete(user.billing_preferences)
-                reset_categories.append('billing')
+        user_info = snapshot['user_info']
+        
+        for name, model in _CATEGORY_MODELS.items():
+            if category is not None and category != name:
+                continue
+            
+            values = dict(_DEFAULTS[model])
+            if model is UserLocalizationSettings:
+                values['language'] = user_info['language'] or 'en'
+                values['timezone'] = user_info['timezone'] or 'UTC'
+            
+            result = db.session.execute(
+                update(model).where(model.user_id == user_id).values(**values)
+            )
+            if getattr(result, "rowcount", 0):
+                reset_categories.append(name)
         
         db.session.commit()
         
@@ -1,6 +1,7 @@
 from tuned.utils.auth.password import (
     hash_password,
     verify_password,
+    make_password_hash,
     check_password_strength,
     generate_temporary_password,
     rehash_password_if_needed
@@ -25,6 +26,7 @@ __all__ = [
     # Password utilities
     'hash_password',
     'verify_password',
+    'make_password_hash',
     'check_password_strength',
     'generate_temporary_password',
     'rehash_password_if_needed',
@@ -1,12 +1,30 @@
 import bcrypt
 import secrets
 import string
+from flask import current_app, has_app_context
+from werkzeug.security import generate_password_hash
 from typing import Tuple, Optional, Any
 
+# Cheapest settings each backend accepts; only used under TESTING_FAST_HASH
+FAST_BCRYPT_ROUNDS = 4
+FAST_HASH_METHOD = 'pbkdf2:sha256:1'
+
+
+def use_fast_hash() -> bool:
+    if not has_app_context():
+        return False
+    return bool(current_app.config.get('TESTING') and current_app.config.get('TESTING_FAST_HASH'))
+
+
+def make_password_hash(password: str) -> str:
+    if use_fast_hash():
+        return generate_password_hash(password, method=FAST_HASH_METHOD)
+    return generate_password_hash(password)
+
 
 def hash_password(password: str) -> str:
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=FAST_BCRYPT_ROUNDS if use_fast_hash() else 12)
     hashed = bcrypt.hashpw(password_bytes, salt)
     
     return hashed.decode('utf-8')
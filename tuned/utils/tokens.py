@@ -1,12 +1,24 @@
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 from flask import current_app
 from typing import Optional, Dict, Any
+from functools import lru_cache
 import secrets
 import string
 
+# Uppercase and digits minus the look-alikes 0/O/I/1: exactly 32 symbols, so
+# masking a random byte to 5 bits picks one uniformly
+_REFERRAL_CODE_CHARS = (string.ascii_uppercase + string.digits).translate(str.maketrans('', '', '0OI1'))
+_REFERRAL_CODE_TABLE = bytes(ord(_REFERRAL_CODE_CHARS[i & 0x1F]) for i in range(256))
+
+
+@lru_cache(maxsize=8)
+def _serializer_for(secret_key: str | bytes) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(secret_key)
+
 
 def get_serializer() -> URLSafeTimedSerializer:
-    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'])
+    # Keyed on the secret itself, so a rotated SECRET_KEY gets a fresh serializer
+    return _serializer_for(current_app.config['SECRET_KEY'])
 
 
 def generate_token(data: Dict[str, Any], salt: str) -> str:
@@ -49,11 +61,8 @@ def verify_password_reset_token(token: str) -> Optional[Dict[str, Any]]:
 
 
 def generate_referral_code(length: int = 8) -> str:
-    chars = string.ascii_uppercase + string.digits
-    chars = chars.replace('0', '').replace('O', '').replace('I', '').replace('1', '')
-    
-    return ''.join(secrets.choice(chars) for _ in range(length))
+    return secrets.token_bytes(length).translate(_REFERRAL_CODE_TABLE).decode('ascii')
 
 
 def generate_secure_random_string(length: int = 32) -> str:
-    return secrets.token_hex(length // 2)
+    return secrets.token_hex((length + 1) // 2)[:length]
@@ -1,21 +1,55 @@
 import re
+import string
 from typing import Optional, Any
 import html
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+\d{10,15}$')
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)]')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*[a-zA-Z0-9]$')
+_URL_RE = re.compile(r'^https?://(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$')
+_RESERVED_USERNAMES = frozenset({'admin', 'root', 'system', 'support', 'help', 'api', 'test'})
+_COMMON_PASSWORDS = frozenset({'password', '12345678', 'password123', 'qwerty123'})
+_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>_-+=[]\\/;'
+
+
+class _PasswordCharClasses(dict[int, str]):
+    """str.translate table: A-Z -> 'U', a-z -> 'L', digits -> 'D', specials -> 'S', anything else dropped."""
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        # Any Unicode decimal digit, same as re's \d
+        return 'D' if chr(codepoint).isdecimal() else None
+
+
+_PASSWORD_CHAR_CLASSES = _PasswordCharClasses(
+    {ord(c): 'U' for c in string.ascii_uppercase}
+    | {ord(c): 'L' for c in string.ascii_lowercase}
+    | {ord(c): 'D' for c in string.digits}
+    | {ord(c): 'S' for c in _SPECIAL_CHARS}
+)
+
 
 def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
     if len(email) > 320:
         return False
     
     if '..' in email:
         return False
+    
+    email = email.strip()
+    # Exactly one '@' with something either side, or the regex can't match
+    at = email.find('@')
+    if at <= 0 or at != email.rfind('@') or at == len(email) - 1:
+        return False
+    
+    local_part = email[:at]
+    if local_part.startswith('.') or local_part.endswith('.'):
+        return False
         
-    return bool(re.match(pattern, email.strip()))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_password_strength(password: str) -> tuple[bool, Optional[str]]:
@@ -28,20 +62,21 @@ def validate_password_strength(password: str) -> tuple[bool, Optional[str]]:
     if len(password) > 128:
         return False, 'Password must not exceed 128 characters'
     
-    if not re.search(r'[A-Z]', password):
+    classes = set(password.translate(_PASSWORD_CHAR_CLASSES))
+    
+    if 'U' not in classes:
         return False, 'Password must contain at least one uppercase letter'
     
-    if not re.search(r'[a-z]', password):
+    if 'L' not in classes:
         return False, 'Password must contain at least one lowercase letter'
     
-    if not re.search(r'\d', password):
+    if 'D' not in classes:
         return False, 'Password must contain at least one digit'
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\\/;]', password):
+    if 'S' not in classes:
         return False, 'Password must contain at least one special character'
     
-    common_passwords = ['password', '12345678', 'password123', 'qwerty123']
-    if password.lower() in common_passwords:
+    if password.lower() in _COMMON_PASSWORDS:
         return False, 'Password is too common, please choose a stronger password'
     
     return True, None
@@ -51,11 +86,9 @@ def validate_phone_number(phone: str) -> bool:
     if not phone or not isinstance(phone, str):
         return False
     
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone)
-    
-    pattern = r'^\+\d{10,15}$'
+    cleaned = _PHONE_SEPARATORS_RE.sub('', phone)
     
-    return bool(re.match(pattern, cleaned))
+    return bool(_PHONE_RE.match(cleaned))
 
 
 def validate_username(username: str) -> tuple[bool, Optional[str]]:
@@ -68,11 +101,10 @@ def validate_username(username: str) -> tuple[bool, Optional[str]]:
     if len(username) > 64:
         return False, 'Username must not exceed 64 characters'
     
-    if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*[a-zA-Z0-9]$', username):
+    if not _USERNAME_RE.match(username):
         return False, 'Username can only contain letters, numbers, underscores, and hyphens'
     
-    reserved = ['admin', 'root', 'system', 'support', 'help', 'api', 'test']
-    if username.lower() in reserved:
+    if username.lower() in _RESERVED_USERNAMES:
         return False, 'This username is reserved'
     
     return True, None
@@ -94,16 +126,20 @@ def validate_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    pattern = r'^https?://(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
-    
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_integer(value: Any, min_value: Optional[int] = None, max_value: Optional[int] = None) -> tuple[bool, Optional[str]]:
-    try:
-        int_value = int(value)
-    except (ValueError, TypeError):
-        return False, 'Must be a valid integer'
+    if isinstance(value, int):
+        int_value = value
+    else:
+        # Turn away non-numeric strings without raising; anything int() accepts still reaches it
+        if isinstance(value, str) and not value.strip().lstrip('+-').replace('_', '').isdecimal():
+            return False, 'Must be a valid integer'
+        try:
+            int_value = int(value)
+        except (ValueError, TypeError):
+            return False, 'Must be a valid integer'
     
     if min_value is not None and int_value < min_value:
         return False, f'Must be at least {min_value}'